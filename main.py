@@ -6,14 +6,21 @@ Date: 2025
 """
 
 import pygame
+import numpy as np
 import random
-from collections import deque
+from collections import OrderedDict, deque
+from itertools import islice
 from enum import Enum
 from typing import Tuple, List, Optional
 import math
-import json
 from pathlib import Path
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional - fall back to vectorized NumPy
+    _HAS_NUMBA = False
+
 
 class Direction(Enum):
     """Enumeration for snake movement directions"""
@@ -23,6 +30,14 @@ class Direction(Enum):
     RIGHT = (1, 0)
 
 
+# Integer direction codes used internally; tables are indexed by code
+DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT = range(4)
+_DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+_DX = tuple(d.value[0] for d in _DIRECTIONS)
+_DY = tuple(d.value[1] for d in _DIRECTIONS)
+_OPP = (DIR_DOWN, DIR_UP, DIR_RIGHT, DIR_LEFT)
+
+
 class GameState(Enum):
     """Game state enumeration"""
     MENU = "menu"
@@ -31,6 +46,30 @@ class GameState(Enum):
     GAME_OVER = "game_over"
 
 
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _step_particles(px, py, vx, vy, life, size, active):
+        """Advance live particles in place by one frame"""
+        for i in range(px.shape[0]):
+            if not active[i]:
+                continue
+            px[i] += vx[i]
+            py[i] += vy[i]
+            vy[i] += 0.3  # Gravity
+            life[i] -= 1
+            size[i] = max(1.0, size[i] - 0.1)
+            active[i] = life[i] > 0
+else:
+    def _step_particles(px, py, vx, vy, life, size, active):
+        """Advance all particle slots in place by one frame"""
+        px += vx
+        py += vy
+        vy += 0.3  # Gravity
+        life -= 1
+        np.maximum(size - 0.1, 1, out=size)
+        active &= life > 0
+
+
 class SnakeGame:
     """
     Professional Snake Game implementation with modern GUI
@@ -56,6 +95,12 @@ class SnakeGame:
         'glow': (100, 255, 200, 50)
     }
     
+    # Upper bound on simultaneously live particles (fixed-size pool)
+    MAX_PARTICLES = 256
+    
+    # Upper bound on cached text surfaces (least recently used are evicted)
+    TEXT_CACHE_SIZE = 64
+    
     def __init__(self, width: int = 800, height: int = 600, cell_size: int = 20):
         """
         Initialize the Snake game
@@ -83,67 +128,135 @@ class SnakeGame:
         self.clock = pygame.time.Clock()
         self.fps = 10
         
+        # Frame timestamp and food pulse, sampled once at the start of each frame
+        self._now_ms = 0
+        self._pulse = 1.0
+        
+        # Screen regions touched this frame and last frame, pushed via display.update
+        self._dirty: List[pygame.Rect] = []
+        self._prev_dirty: List[pygame.Rect] = []
+        self._drawn_state = None
+        
+        # Static grid pre-rendered once and blitted each frame
+        self._grid_surface = self._build_grid_surface()
+        
+        # Darkening overlays for the game over and pause screens
+        self._game_over_overlay = self._build_overlay(128)
+        self._pause_overlay = self._build_overlay(64)
+        
+        # Special food star sprite pre-rotated at 15 degree steps
+        self._star_rot = self._build_star_rotations(24)
+        
         # Fonts for modern UI
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 32)
         
+        # Rendered text surfaces keyed by (font id, text, color), in LRU order
+        self._text_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        
+        # Pre-rendered glow surfaces keyed by (color, radius)
+        self._glow_cache: dict[tuple, pygame.Surface] = {}
+        
+        # Pre-rendered particle discs keyed by (color, radius, alpha)
+        self._disc_cache: dict[tuple, pygame.Surface] = {}
+        
         # Game state
         self.state = GameState.MENU
         self.score = 0
         self.high_score = self._load_high_score()
         
+        # Composited HUD text blocks, re-rendered only when score, best or speed change
+        self._hud_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._hud_rects: List[pygame.Rect] = []
+        self._hud_dirty = True
+        
         # Snake data structure - optimized with deque
         self.snake = deque()
-        self.direction = Direction.RIGHT
-        self.next_direction = Direction.RIGHT
+        # Packed cell ids mirroring the deque for O(1) lookups; always go through
+        # _pack so the encoding lives in one place
+        self._occupied: set[int] = set()
+        self._dir = DIR_RIGHT
+        self._next_dir = DIR_RIGHT
         self.growing = False
         
+        # Snake body sprites, one per gradient palette entry
+        self._segment_surfs = [
+            self._build_segment_surface(color) for color in self.COLORS['snake_gradient']
+        ]
+        
+        # Per-segment sprite ramp, rebuilt only when the snake length changes
+        self._gradient_lut: List[pygame.Surface] = []
+        self._gradient_len = -1
+        
         # Food
         self.food_pos = None
         self.special_food_pos = None
         self.special_food_timer = 0
         
-        # Visual effects
-        self.particles = []
+        # Visual effects - particles stored as fixed-capacity NumPy arrays (SoA)
+        self.p_x = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self.p_y = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self.p_vx = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self.p_vy = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self.p_life = np.zeros(self.MAX_PARTICLES, dtype=np.int32)
+        self.p_size = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self.p_color_idx = np.zeros(self.MAX_PARTICLES, dtype=np.uint8)
+        self.p_active = np.zeros(self.MAX_PARTICLES, dtype=bool)
+        self.particle_colors = (self.COLORS['food'], self.COLORS['special_food'])
         self.animations = []
         self.transition_alpha = 0
         
-        # Performance optimization - pre-calculate common values
-        self.direction_opposites = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT
-        }
-        
-        # Input mapping for cleaner code
+        # Input mapping for cleaner code - keys map straight to direction codes
         self.key_mapping = {
-            pygame.K_UP: Direction.UP,
-            pygame.K_DOWN: Direction.DOWN,
-            pygame.K_LEFT: Direction.LEFT,
-            pygame.K_RIGHT: Direction.RIGHT,
-            pygame.K_w: Direction.UP,
-            pygame.K_s: Direction.DOWN,
-            pygame.K_a: Direction.LEFT,
-            pygame.K_d: Direction.RIGHT
+            pygame.K_UP: DIR_UP,
+            pygame.K_DOWN: DIR_DOWN,
+            pygame.K_LEFT: DIR_LEFT,
+            pygame.K_RIGHT: DIR_RIGHT,
+            pygame.K_w: DIR_UP,
+            pygame.K_s: DIR_DOWN,
+            pygame.K_a: DIR_LEFT,
+            pygame.K_d: DIR_RIGHT
         }
         
         # Initialize game
         self._reset_game()
+        
+        # Compile the particle kernel now (all slots inactive, so this is a no-op)
+        # rather than stalling on the first frame of play
+        if _HAS_NUMBA:
+            self._update_particles()
+    
+    @property
+    def direction(self) -> Direction:
+        """Current movement direction"""
+        return _DIRECTIONS[self._dir]
     
     def _load_high_score(self) -> int:
         """Load high score from file"""
+        save_file = Path("high_score.txt")
+        if not save_file.exists():
+            return self._migrate_legacy_high_score()
+        try:
+            return int(save_file.read_text().strip())
+        except:
+            return 0
+    
+    def _migrate_legacy_high_score(self) -> int:
+        """Import the score from an old high_score.json and rewrite it as text"""
         try:
-            save_file = Path("high_score.json")
-            return json.loads(save_file.read_text()).get("high_score", 0) if save_file.exists() else 0
+            # Legacy format is {"high_score": N}; parse it without importing json
+            legacy = Path("high_score.json").read_text()
+            score = int(legacy.partition(":")[2].strip().rstrip("}").strip())
+            Path("high_score.txt").write_text(str(score))
+            return score
         except:
             return 0
     
     def _save_high_score(self):
         """Save high score to file"""
         try:
-            Path("high_score.json").write_text(json.dumps({"high_score": self.high_score}))
+            Path("high_score.txt").write_text(str(self.high_score))
         except:
             pass
     
@@ -159,66 +272,79 @@ class SnakeGame:
             (center_x - 1, center_y),
             (center_x, center_y)
         ])
+        self._occupied.clear()
+        self._occupied.update(self._pack(segment) for segment in self.snake)
         
-        self.direction = Direction.RIGHT
-        self.next_direction = Direction.RIGHT
+        self._dir = DIR_RIGHT
+        self._next_dir = DIR_RIGHT
         self.score = 0
+        self._hud_dirty = True
         self.growing = False
         self.special_food_timer = 0
         
         self._spawn_food()
-        self.particles.clear()
+        self._reset_particles()
         self.animations.clear()
     
+    def _reset_particles(self):
+        """Deactivate all particles"""
+        self.p_active[:] = False
+    
     def _spawn_food(self):
         """Spawn food at random location not occupied by snake"""
-        # Use set for O(1) lookup performance
-        snake_positions = set(self.snake)
-        
-        # Find valid positions
-        valid_positions = [
-            (x, y) 
-            for x in range(self.grid_width) 
-            for y in range(self.grid_height)
-            if (x, y) not in snake_positions
-        ]
+        free_cells = self.grid_width * self.grid_height - len(self._occupied)
         
-        self.food_pos = random.choice(valid_positions) if valid_positions else None
+        self.food_pos = self._random_free_cell() if free_cells > 0 else None
         
-        # Spawn special food occasionally
+        # Spawn special food occasionally, never on top of regular food
         self.special_food_pos = (
-            random.choice(valid_positions) 
-            if valid_positions and random.random() < 0.1 
+            self._random_free_cell(self.food_pos)
+            if free_cells > 1 and random.random() < 0.1
             else None
         )
         self.special_food_timer = 150 if self.special_food_pos else 0
     
+    def _pack(self, pos: Tuple[int, int]) -> int:
+        """Pack a grid position into a single integer cell id"""
+        return pos[0] * self.grid_height + pos[1]
+    
+    def _random_free_cell(self, exclude: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+        """Pick a random cell not covered by the snake using rejection sampling"""
+        width, height = self.grid_width, self.grid_height
+        occupied = self._occupied
+        randrange = random.randrange  # local alias avoids global lookups per retry
+        while True:
+            x, y = randrange(width), randrange(height)
+            pos = (x, y)
+            if self._pack(pos) not in occupied and pos != exclude:
+                return pos
+    
     def _handle_input(self, event: pygame.event.Event):
         """Handle keyboard input events"""
         # Use dictionary lookup instead of if-else chains
-        new_direction = self.key_mapping.get(event.key)
+        new_dir = self.key_mapping.get(event.key)
         
-        if new_direction and new_direction != self.direction_opposites.get(self.direction):
-            self.next_direction = new_direction
+        if new_dir is not None and new_dir != _OPP[self._dir]:
+            self._next_dir = new_dir
     
     def _move_snake(self):
         """Move snake in current direction"""
-        self.direction = self.next_direction
+        self._dir = d = self._next_dir
         head = self.snake[-1]
-        dx, dy = self.direction.value
-        new_head = (head[0] + dx, head[1] + dy)
+        x, y = head[0] + _DX[d], head[1] + _DY[d]
+        new_head = (x, y)
         
-        # Check collisions using mathematical operations
-        wall_collision = not (0 <= new_head[0] < self.grid_width and 
-                             0 <= new_head[1] < self.grid_height)
-        self_collision = new_head in self.snake
+        # Check collisions using non-short-circuiting bitwise operations
+        wall_collision = (x < 0) | (x >= self.grid_width) | (y < 0) | (y >= self.grid_height)
+        new_key = self._pack(new_head)
         
-        if wall_collision or self_collision:
+        if wall_collision or new_key in self._occupied:
             self._game_over()
             return
         
         # Move snake
         self.snake.append(new_head)
+        self._occupied.add(new_key)
         
         # Check food collision
         food_eaten = new_head == self.food_pos
@@ -227,6 +353,7 @@ class SnakeGame:
         if food_eaten or special_eaten:
             points = 10 if food_eaten else 50
             self.score += points
+            self._hud_dirty = True
             self.growing = True
             self._create_eat_effect(new_head, special_eaten)
             
@@ -239,7 +366,7 @@ class SnakeGame:
         
         # Remove tail if not growing
         if not self.growing:
-            self.snake.popleft()
+            self._occupied.discard(self._pack(self.snake.popleft()))
         else:
             self.growing = False
     
@@ -250,103 +377,112 @@ class SnakeGame:
         
         # Create multiple particles
         particle_count = 20 if special else 10
-        color = self.COLORS['special_food'] if special else self.COLORS['food']
-        
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            self.particles.append({
-                'x': screen_x,
-                'y': screen_y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 30,
-                'color': color,
-                'size': random.randint(2, 5)
-            })
+        
+        # Reuse inactive slots; excess particles are dropped when the pool is full
+        slots = np.flatnonzero(~self.p_active)[:particle_count]
+        n = len(slots)
+        angle = np.random.uniform(0, 2 * np.pi, n).astype(np.float32)
+        speed = np.random.uniform(2, 6, n).astype(np.float32)
+        
+        self.p_x[slots] = screen_x
+        self.p_y[slots] = screen_y
+        self.p_vx[slots] = np.cos(angle) * speed
+        self.p_vy[slots] = np.sin(angle) * speed
+        self.p_life[slots] = 30
+        self.p_size[slots] = np.random.randint(2, 6, n)
+        self.p_color_idx[slots] = special
+        self.p_active[slots] = True
     
     def _update_particles(self):
-        """Update particle positions and remove dead particles"""
-        self.particles = [
-            {
-                **p,
-                'x': p['x'] + p['vx'],
-                'y': p['y'] + p['vy'],
-                'vy': p['vy'] + 0.3,  # Gravity
-                'life': p['life'] - 1,
-                'size': max(1, p['size'] - 0.1)
-            }
-            for p in self.particles
-            if p['life'] > 0
-        ]
+        """Advance all particles with vectorized physics and retire dead ones"""
+        _step_particles(self.p_x, self.p_y, self.p_vx, self.p_vy,
+                        self.p_life, self.p_size, self.p_active)
     
     def _game_over(self):
         """Handle game over state"""
         self.state = GameState.GAME_OVER
         if self.score > self.high_score:
             self.high_score = self.score
+            self._hud_dirty = True
             self._save_high_score()
     
-    def _draw_grid(self):
-        """Draw subtle grid pattern"""
+    def _build_grid_surface(self) -> pygame.Surface:
+        """Render background and grid lines onto a reusable surface"""
+        surf = pygame.Surface((self.width, self.height)).convert()
+        surf.fill(self.COLORS['background'])
         for x in range(0, self.width, self.cell_size):
-            pygame.draw.line(self.screen, self.COLORS['grid'], 
+            pygame.draw.line(surf, self.COLORS['grid'], 
                            (x, 0), (x, self.height), 1)
         for y in range(0, self.height, self.cell_size):
-            pygame.draw.line(self.screen, self.COLORS['grid'], 
+            pygame.draw.line(surf, self.COLORS['grid'], 
                            (0, y), (self.width, y), 1)
+        return surf
+    
+    def _build_overlay(self, alpha: int) -> pygame.Surface:
+        """Create a full-screen black overlay with the given surface alpha"""
+        overlay = pygame.Surface((self.width, self.height)).convert()
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(alpha)
+        return overlay
+    
+    def _draw_grid(self):
+        """Draw background with subtle grid pattern"""
+        self.screen.blit(self._grid_surface, (0, 0))
+    
+    def _build_segment_surface(self, color: Tuple) -> pygame.Surface:
+        """Render a rounded body segment sprite in the given color"""
+        surf = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.rect(surf, color, surf.get_rect(), border_radius=4)
+        return surf
     
     def _draw_snake(self):
         """Draw snake with gradient effect"""
         segment_count = len(self.snake)
-        
-        for i, segment in enumerate(self.snake):
-            # Calculate color gradient
-            gradient_ratio = i / max(segment_count - 1, 1)
-            color = self._interpolate_color(
-                self.COLORS['snake_gradient'][0],
-                self.COLORS['snake_gradient'][-1],
-                gradient_ratio
-            )
-            
-            # Draw segment with rounded corners
-            rect = pygame.Rect(
-                segment[0] * self.cell_size,
-                segment[1] * self.cell_size,
-                self.cell_size,
-                self.cell_size
-            )
-            
-            # Draw main body
-            pygame.draw.rect(self.screen, color, rect, border_radius=4)
-            
-            # Draw head with special effect
-            if i == segment_count - 1:
-                pygame.draw.rect(self.screen, self.COLORS['snake_head'], rect, border_radius=6)
-                # Add glow effect
-                self._draw_glow(rect.center, self.COLORS['snake_head'], 20)
-    
-    def _interpolate_color(self, color1: Tuple, color2: Tuple, ratio: float) -> Tuple:
-        """Interpolate between two colors"""
-        return tuple(int(c1 + (c2 - c1) * ratio) for c1, c2 in zip(color1, color2))
+        cs = self.cell_size
+        
+        # Rebuild gradient lookup table on length change, quantized to the palette
+        if segment_count != self._gradient_len:
+            last = len(self._segment_surfs) - 1
+            self._gradient_lut = [
+                self._segment_surfs[round(last * i / max(segment_count - 1, 1))]
+                for i in range(segment_count)
+            ]
+            self._gradient_len = segment_count
+        
+        # Draw body segments (everything but the head) in a single batched call
+        body = islice(self.snake, segment_count - 1)
+        self._dirty.extend(self.screen.blits(
+            [(surf, (x * cs, y * cs)) for surf, (x, y) in zip(self._gradient_lut, body)]
+        ))
+        
+        # Draw head with special effect
+        head = self.snake[-1]
+        rect = pygame.Rect(head[0] * cs, head[1] * cs, cs, cs)
+        self._dirty.append(
+            pygame.draw.rect(self.screen, self.COLORS['snake_head'], rect, border_radius=6)
+        )
+        # Add glow effect
+        self._draw_glow(rect.center, self.COLORS['snake_head'], 20)
     
     def _draw_glow(self, pos: Tuple[int, int], color: Tuple, radius: int):
         """Draw glow effect"""
-        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        steps = 10
-        for i in range(steps):
-            alpha = int(50 * (1 - i / steps))
-            r = int(radius * (1 - i / steps))
-            glow_color = (*color, alpha)
-            pygame.draw.circle(surf, glow_color, (radius, radius), r)
-        self.screen.blit(surf, (pos[0] - radius, pos[1] - radius))
+        key = (color, radius)
+        surf = self._glow_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA).convert_alpha()
+            steps = 10
+            for i in range(steps):
+                alpha = int(50 * (1 - i / steps))
+                r = int(radius * (1 - i / steps))
+                glow_color = (*color, alpha)
+                pygame.draw.circle(surf, glow_color, (radius, radius), r)
+            self._glow_cache[key] = surf
+        self._dirty.append(self.screen.blit(surf, (pos[0] - radius, pos[1] - radius)))
     
     def _draw_food(self):
         """Draw food with pulsing effect"""
         if self.food_pos:
-            # Calculate pulse effect
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.005)) * 0.2 + 0.8
-            size = int(self.cell_size * pulse)
+            size = int(self.cell_size * self._pulse)
             offset = (self.cell_size - size) // 2
             
             rect = pygame.Rect(
@@ -356,6 +492,13 @@ class SnakeGame:
                 size
             )
             pygame.draw.rect(self.screen, self.COLORS['food'], rect, border_radius=size//2)
+            # Mark the full cell so the previous, larger pulse frame gets cleared
+            self._dirty.append(pygame.Rect(
+                self.food_pos[0] * self.cell_size,
+                self.food_pos[1] * self.cell_size,
+                self.cell_size,
+                self.cell_size
+            ))
             
         # Draw special food with rotation
         if self.special_food_pos and self.special_food_timer > 0:
@@ -366,74 +509,134 @@ class SnakeGame:
                 self.special_food_pos[1] * self.cell_size + self.cell_size // 2
             )
             
-            # Draw rotating star
-            angle = pygame.time.get_ticks() * 0.002
-            points = []
-            for i in range(8):
-                a = angle + i * math.pi / 4
-                r = self.cell_size // 2 if i % 2 == 0 else self.cell_size // 4
-                x = center[0] + math.cos(a) * r
-                y = center[1] + math.sin(a) * r
-                points.append((x, y))
-            
-            pygame.draw.polygon(self.screen, self.COLORS['special_food'], points)
+            # Draw rotating star from the nearest pre-rotated sprite
+            angle = self._now_ms * 0.002
+            steps = len(self._star_rot)
+            star = self._star_rot[int(angle / (2 * math.pi) * steps) % steps]
+            self._dirty.append(self.screen.blit(star, star.get_rect(center=center)))
             self._draw_glow(center, self.COLORS['special_food'], 25)
             
             if self.special_food_timer == 0:
                 self.special_food_pos = None
     
+    def _build_star_rotations(self, steps: int) -> List[pygame.Surface]:
+        """Render the special food star once and cache its rotations"""
+        cs = self.cell_size
+        # One pixel of padding per side keeps the outer tips from being clipped
+        sprite = pygame.Surface((cs + 2, cs + 2), pygame.SRCALPHA).convert_alpha()
+        c = (cs + 2) / 2
+        points = [
+            (c + math.cos(i * math.pi / 4) * r, c + math.sin(i * math.pi / 4) * r)
+            for i, r in enumerate([cs // 2, cs // 4] * 4)
+        ]
+        pygame.draw.polygon(sprite, self.COLORS['special_food'], points)
+        # Negative angles: screen y points down, so the star turns clockwise
+        return [pygame.transform.rotate(sprite, -i * 360 / steps) for i in range(steps)]
+    
+    def _get_disc(self, color: Tuple, size: int, alpha: int) -> pygame.Surface:
+        """Return a cached translucent disc sprite"""
+        key = (color, size, alpha)
+        surf = self._disc_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(surf, (*color, alpha), (size, size), size)
+            self._disc_cache[key] = surf
+        return surf
+    
     def _draw_particles(self):
         """Draw particle effects"""
-        for particle in self.particles:
-            alpha = int(255 * (particle['life'] / 30))
-            color = (*particle['color'], alpha)
-            
-            surf = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color, 
-                             (particle['size'], particle['size']), 
-                             particle['size'])
-            self.screen.blit(surf, 
-                           (particle['x'] - particle['size'], 
-                            particle['y'] - particle['size']))
+        # Gather live particles as plain Python lists and bind hot names locally
+        active = np.flatnonzero(self.p_active)
+        get_disc = self._get_disc
+        colors = self.particle_colors
+        blit_sequence = []
+        append = blit_sequence.append
+        
+        for x, y, size, life, color_idx in zip(
+            self.p_x[active].tolist(),
+            self.p_y[active].tolist(),
+            self.p_size[active].astype(np.int32).tolist(),
+            self.p_life[active].tolist(),
+            self.p_color_idx[active].tolist()
+        ):
+            alpha = int(255 * (life / 30))
+            append((get_disc(colors[color_idx], size, alpha), (x - size, y - size)))
+        self._dirty.extend(self.screen.blits(blit_sequence))
     
     def _draw_ui(self):
         """Draw user interface elements"""
-        # Score display with shadow
-        score_text = f"Score: {self.score}"
-        self._draw_text_with_shadow(score_text, (20, 20), self.font_medium)
-        
-        # High score
-        high_score_text = f"Best: {self.high_score}"
-        self._draw_text_with_shadow(high_score_text, (20, 60), self.font_small)
+        if self._hud_dirty:
+            # Previous blocks may be larger than the new ones - refresh their area too
+            self._dirty.extend(self._hud_rects)
+            
+            # Score and high score block
+            score_block = self._render_text_block([
+                (f"Score: {self.score}", self.font_medium, (0, 0)),
+                (f"Best: {self.high_score}", self.font_small, (0, 40))
+            ])
+            
+            # FPS display
+            speed_block = self._render_text_block([
+                (f"Speed: {self.fps}", self.font_small, (0, 0))
+            ])
+            
+            self._hud_blits = [(score_block, (20, 20)), (speed_block, (self.width - 150, 20))]
+            self._hud_rects = [surf.get_rect(topleft=pos) for surf, pos in self._hud_blits]
+            self._dirty.extend(self._hud_rects)
+            self._hud_dirty = False
         
-        # FPS display
-        fps_text = f"Speed: {self.fps}"
-        self._draw_text_with_shadow(fps_text, (self.width - 150, 20), self.font_small)
+        self.screen.blits(self._hud_blits, doreturn=False)
+    
+    def _render_text_block(self, lines: List[Tuple[str, pygame.font.Font, Tuple[int, int]]]) -> pygame.Surface:
+        """Render shadowed text lines onto a surface sized to fit them"""
+        sizes = [font.size(text) for text, font, _ in lines]
+        # Shadow is offset by 2 pixels on both axes
+        width = max(w + offset[0] for (w, _), (_, _, offset) in zip(sizes, lines)) + 2
+        height = max(h + offset[1] for (_, h), (_, _, offset) in zip(sizes, lines)) + 2
+        
+        surf = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        for text, font, offset in lines:
+            self._draw_text_with_shadow(surf, text, offset, font)
+        return surf
+    
+    def _render_cached(self, text: str, font: pygame.font.Font, color: Tuple) -> pygame.Surface:
+        """Render text once and reuse the surface on subsequent calls"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+            # Evict stale strings such as old scores so the cache stays bounded
+            if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
     
-    def _draw_text_with_shadow(self, text: str, pos: Tuple[int, int], font):
-        """Draw text with shadow effect"""
+    def _draw_text_with_shadow(self, target: pygame.Surface, text: str, pos: Tuple[int, int], font):
+        """Draw text with shadow effect onto target surface"""
         # Shadow
-        shadow_surf = font.render(text, True, self.COLORS['text_shadow'])
-        self.screen.blit(shadow_surf, (pos[0] + 2, pos[1] + 2))
+        shadow_surf = self._render_cached(text, font, self.COLORS['text_shadow'])
+        target.blit(shadow_surf, (pos[0] + 2, pos[1] + 2))
         
         # Main text
-        text_surf = font.render(text, True, self.COLORS['text'])
-        self.screen.blit(text_surf, pos)
+        text_surf = self._render_cached(text, font, self.COLORS['text'])
+        target.blit(text_surf, pos)
     
     def _draw_menu(self):
         """Draw main menu"""
         # Title with animation
-        title_y = 100 + math.sin(pygame.time.get_ticks() * 0.002) * 10
+        title_y = 100 + math.sin(self._now_ms * 0.002) * 10
         title_text = "SNAKE"
-        title_surf = self.font_large.render(title_text, True, self.COLORS['snake_head'])
+        title_surf = self._render_cached(title_text, self.font_large, self.COLORS['snake_head'])
         title_rect = title_surf.get_rect(center=(self.width // 2, title_y))
-        self.screen.blit(title_surf, title_rect)
+        self._dirty.append(self.screen.blit(title_surf, title_rect))
         
         # Subtitle
         subtitle_text = "Professional Edition"
-        subtitle_surf = self.font_medium.render(subtitle_text, True, self.COLORS['text'])
+        subtitle_surf = self._render_cached(subtitle_text, self.font_medium, self.COLORS['text'])
         subtitle_rect = subtitle_surf.get_rect(center=(self.width // 2, title_y + 60))
-        self.screen.blit(subtitle_surf, subtitle_rect)
+        self._dirty.append(self.screen.blit(subtitle_surf, subtitle_rect))
         
         # Instructions
         instructions = [
@@ -445,68 +648,62 @@ class SnakeGame:
         
         y_offset = 250
         for instruction in instructions:
-            inst_surf = self.font_small.render(instruction, True, self.COLORS['text'])
+            inst_surf = self._render_cached(instruction, self.font_small, self.COLORS['text'])
             inst_rect = inst_surf.get_rect(center=(self.width // 2, y_offset))
-            self.screen.blit(inst_surf, inst_rect)
+            self._dirty.append(self.screen.blit(inst_surf, inst_rect))
             y_offset += 40
         
         # High score display
         if self.high_score > 0:
             hs_text = f"High Score: {self.high_score}"
-            hs_surf = self.font_medium.render(hs_text, True, self.COLORS['special_food'])
+            hs_surf = self._render_cached(hs_text, self.font_medium, self.COLORS['special_food'])
             hs_rect = hs_surf.get_rect(center=(self.width // 2, self.height - 100))
-            self.screen.blit(hs_surf, hs_rect)
+            self._dirty.append(self.screen.blit(hs_surf, hs_rect))
     
     def _draw_game_over(self):
-        """Draw game over screen"""
+        """Draw game over screen (static, repainted in full on state change)"""
         # Darken background
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._game_over_overlay, (0, 0))
         
         # Game over text
         go_text = "GAME OVER"
-        go_surf = self.font_large.render(go_text, True, self.COLORS['game_over'])
+        go_surf = self._render_cached(go_text, self.font_large, self.COLORS['game_over'])
         go_rect = go_surf.get_rect(center=(self.width // 2, self.height // 2 - 100))
         self.screen.blit(go_surf, go_rect)
         
         # Score
         score_text = f"Final Score: {self.score}"
-        score_surf = self.font_medium.render(score_text, True, self.COLORS['text'])
+        score_surf = self._render_cached(score_text, self.font_medium, self.COLORS['text'])
         score_rect = score_surf.get_rect(center=(self.width // 2, self.height // 2))
         self.screen.blit(score_surf, score_rect)
         
         # New high score notification
         if self.score == self.high_score and self.score > 0:
             nh_text = "NEW HIGH SCORE!"
-            nh_surf = self.font_medium.render(nh_text, True, self.COLORS['special_food'])
+            nh_surf = self._render_cached(nh_text, self.font_medium, self.COLORS['special_food'])
             nh_rect = nh_surf.get_rect(center=(self.width // 2, self.height // 2 + 50))
             self.screen.blit(nh_surf, nh_rect)
         
         # Restart instruction
         restart_text = "Press SPACE to Play Again or ESC to Quit"
-        restart_surf = self.font_small.render(restart_text, True, self.COLORS['text'])
+        restart_surf = self._render_cached(restart_text, self.font_small, self.COLORS['text'])
         restart_rect = restart_surf.get_rect(center=(self.width // 2, self.height - 100))
         self.screen.blit(restart_surf, restart_rect)
     
     def _draw_pause(self):
-        """Draw pause overlay"""
+        """Draw pause overlay (static, repainted in full on state change)"""
         # Darken background
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(64)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._pause_overlay, (0, 0))
         
         # Pause text
         pause_text = "PAUSED"
-        pause_surf = self.font_large.render(pause_text, True, self.COLORS['pause'])
+        pause_surf = self._render_cached(pause_text, self.font_large, self.COLORS['pause'])
         pause_rect = pause_surf.get_rect(center=(self.width // 2, self.height // 2))
         self.screen.blit(pause_surf, pause_rect)
         
         # Resume instruction
         resume_text = "Press P to Resume"
-        resume_surf = self.font_small.render(resume_text, True, self.COLORS['text'])
+        resume_surf = self._render_cached(resume_text, self.font_small, self.COLORS['text'])
         resume_rect = resume_surf.get_rect(center=(self.width // 2, self.height // 2 + 60))
         self.screen.blit(resume_surf, resume_rect)
     
@@ -515,10 +712,17 @@ class SnakeGame:
         running = True
         
         while running:
+            self._now_ms = pygame.time.get_ticks()
+            self._pulse = abs(math.sin(self._now_ms * 0.005)) * 0.2 + 0.8
+            
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                
+                elif event.type == pygame.WINDOWEXPOSED:
+                    # Window contents were lost - force a full repaint
+                    self._drawn_state = None
                     
                 elif event.type == pygame.KEYDOWN:
                     # Global keys
@@ -552,12 +756,17 @@ class SnakeGame:
                 self._update_particles()
                 
                 # Increase speed based on score
-                self.fps = min(10 + self.score // 50, 20)
+                fps = min(10 + self.score // 50, 20)
+                if fps != self.fps:
+                    self.fps = fps
+                    self._hud_dirty = True
             
-            # Clear screen
-            self.screen.fill(self.COLORS['background'])
+            # Repaint everything whenever the state (and so the layout) changes
+            if self.state != self._drawn_state:
+                self._dirty.append(self.screen.get_rect())
+                self._drawn_state = self.state
             
-            # Draw based on state
+            # Draw based on state - the grid surface doubles as the cleared background
             if self.state == GameState.PLAYING:
                 self._draw_grid()
                 self._draw_food()
@@ -565,6 +774,7 @@ class SnakeGame:
                 self._draw_particles()
                 self._draw_ui()
             elif self.state == GameState.MENU:
+                self.screen.fill(self.COLORS['background'])
                 self._draw_menu()
             elif self.state == GameState.PAUSED:
                 self._draw_grid()
@@ -577,8 +787,10 @@ class SnakeGame:
                 self._draw_snake()
                 self._draw_game_over()
             
-            # Update display
-            pygame.display.flip()
+            # Update display - push only regions drawn this frame or last frame
+            pygame.display.update(self._prev_dirty + self._dirty)
+            self._prev_dirty, self._dirty = self._dirty, self._prev_dirty
+            self._dirty.clear()
             self.clock.tick(self.fps)
         
         # Cleanup